@@ -58,7 +58,7 @@ class CPU64NoopOperator(OperatorCore):
 
         # Shared-memory parallelism
         if options['openmp']:
-            ompizer = Ompizer()
+            ompizer = Ompizer(options=options)
             ompizer.make_parallel(graph)
 
         # Symbol definitions
@@ -131,7 +131,7 @@ class CPU64Operator(CPU64NoopOperator):
         relax_incr_dimensions(graph, counter=generator())
 
         # Shared-memory and SIMD-level parallelism
-        ompizer = Ompizer()
+        ompizer = Ompizer(options=options)
         ompizer.make_simd(graph, simd_reg_size=platform.simd_reg_size)
         if options['openmp']:
             ompizer.make_parallel(graph)
@@ -222,7 +222,7 @@ class CustomOperator(CPU64Operator):
         options = kwargs['options']
         platform = kwargs['platform']
 
-        ompizer = Ompizer()
+        ompizer = Ompizer(options=options)
 
         return {
             'denormals': avoid_denormals,
@@ -266,7 +266,7 @@ class DeviceOpenMPNoopOperator(OperatorCore):
             mpiize(graph, mode=options['mpi'])
 
         # GPU parallelism via OpenMP offloading
-        DeviceOmpizer().make_parallel(graph)
+        DeviceOmpizer(options=options).make_parallel(graph)
 
         # Symbol definitions
         data_manager = DeviceDataManager()
@@ -290,7 +290,7 @@ class DeviceOpenMPOperator(DeviceOpenMPNoopOperator):
             mpiize(graph, mode=options['mpi'])
 
         # GPU parallelism via OpenMP offloading
-        DeviceOmpizer().make_parallel(graph)
+        DeviceOmpizer(options=options).make_parallel(graph)
 
         # Misc optimizations
         hoist_prodders(graph)
@@ -314,7 +314,7 @@ class DeviceOpenMPCustomOperator(DeviceOpenMPOperator):
     def _make_passes_mapper(cls, **kwargs):
         options = kwargs['options']
 
-        ompizer = DeviceOmpizer()
+        ompizer = DeviceOmpizer(options=options)
 
         return {
             'optcomms': partial(optimize_halospots),
@@ -1,5 +1,6 @@
 from collections import OrderedDict
 from functools import reduce
+from heapq import nlargest
 from operator import attrgetter, mul
 from math import ceil
 
@@ -404,7 +405,9 @@ class Operator(Callable):
         parameters = derive_parameters(iet, True)
         iet = Callable(name, iet, 'int', parameters, ())
 
-        # Lower IET to a target-specific IET
+        # Lower IET to a target-specific IET. Note: the Graph is deliberately not
+        # cached, as `_specialize_iet` transforms it in place and `iet` is a
+        # brand new object for each Operator anyway
         graph = Graph(iet)
         graph = cls._specialize_iet(graph, **kwargs)
 
@@ -702,9 +705,9 @@ class Operator(Callable):
         threshold = 20.
 
         def _emit_timings(timings, indent=''):
-            timings.pop('total', None)
-            entries = sorted(timings, key=lambda i: timings[i]['total'], reverse=True)
-            for i in entries[:max_hotspots]:
+            entries = nlargest(max_hotspots, (i for i in timings if i != 'total'),
+                               key=lambda i: timings[i]['total'])
+            for i in entries:
                 v = fround(timings[i]['total'])
                 perc = fround(v/tot*100, n=10)
                 if perc > threshold:
@@ -941,6 +944,9 @@ def parse_kwargs(**kwargs):
     options.setdefault('min-storage', opt_options.get('min-storage', False))
     options.setdefault('cire-repeats-inv', opt_options.get('cire-repeats-inv', None))
     options.setdefault('cire-repeats-sops', opt_options.get('cire-repeats-sops', None))
+    options.setdefault('par-collapse-ncores', opt_options.get('par-collapse-ncores'))
+    options.setdefault('par-collapse-work', opt_options.get('par-collapse-work'))
+    options.setdefault('par-nested', opt_options.get('par-nested'))
     options.setdefault('openmp', openmp)
     options.setdefault('mpi', configuration['mpi'])
     kwargs['options'] = options
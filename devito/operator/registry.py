@@ -1,4 +1,3 @@
-from collections import OrderedDict
 from itertools import product
 
 from devito.archinfo import Platform
@@ -8,7 +7,7 @@ from devito.tools import Singleton
 __all__ = ['operator_registry', 'operator_selector']
 
 
-class OperatorRegistry(OrderedDict, metaclass=Singleton):
+class OperatorRegistry(dict, metaclass=Singleton):
 
     """
     A registry for Operators:
@@ -29,12 +28,30 @@ class OperatorRegistry(OrderedDict, metaclass=Singleton):
     _languages = ('C',)
     _accepted = _modes + tuple(product(_modes, _languages))
 
+    def __init__(self, *args, **kwargs):
+        super(OperatorRegistry, self).__init__(*args, **kwargs)
+
+        # Flattened `(platform class, mode, language) -> operator` dispatch
+        # table, in which each registered platform is expanded along its MRO
+        self._dispatch = {}
+
+        # Memoized `fetch` results, keyed by the actual platform class
+        self._fetched = {}
+
     def add(self, operator, platform, mode, language='C'):
         assert issubclass(platform, Platform)
         assert mode in OperatorRegistry._modes or mode == 'custom'
 
         self[(platform, mode, language)] = operator
 
+        # An ancestor maps to the first registered platform deriving from it
+        self._dispatch[(platform, mode, language)] = operator
+        for cls in platform.mro()[1:]:
+            self._dispatch.setdefault((cls, mode, language), operator)
+
+        # A new registration may change the resolution of any platform class
+        self._fetched.clear()
+
     def fetch(self, platform=None, mode=None, language='C', **kwargs):
         """
         Retrieve an Operator for the given `<platform, mode, language>`.
@@ -46,12 +63,22 @@ class OperatorRegistry(OrderedDict, metaclass=Singleton):
         if language not in OperatorRegistry._languages:
             raise ValueError("Unknown language `%s`" % language)
 
-        for cls in platform.__class__.mro():
-            for (p, m, l), kls in self.items():
-                if issubclass(p, cls) and m == mode and l == language:
-                    return kls
-
-        raise InvalidOperator("Cannot compile an Operator for `%s`" % str((p, m, l)))
+        key = (type(platform), mode, language)
+        try:
+            return self._fetched[key]
+        except KeyError:
+            pass
+
+        for cls in type(platform).mro():
+            try:
+                operator = self._dispatch[(cls, mode, language)]
+            except KeyError:
+                continue
+            self._fetched[key] = operator
+            return operator
+
+        raise InvalidOperator("Cannot compile an Operator for `%s`"
+                              % str((platform, mode, language)))
 
 
 operator_registry = OperatorRegistry()
@@ -239,13 +239,28 @@ class Ompizer(object):
     Shortcuts for the OpenMP language.
     """
 
-    def __init__(self, key=None):
+    def __init__(self, key=None, options=None):
         """
         Parameters
         ----------
         key : callable, optional
             Return True if an Iteration can be parallelized, False otherwise.
+        options : dict, optional
+            Override the default heuristics. Accepted keys are `par-collapse-ncores`,
+            `par-collapse-work` and `par-nested`, which replace `COLLAPSE_NCORES`,
+            `COLLAPSE_WORK` and `NESTED`, respectively.
         """
+        options = options or {}
+        self.collapse_ncores = options.get('par-collapse-ncores')
+        if self.collapse_ncores is None:
+            self.collapse_ncores = self.COLLAPSE_NCORES
+        self.collapse_work = options.get('par-collapse-work')
+        if self.collapse_work is None:
+            self.collapse_work = self.COLLAPSE_WORK
+        self.nested = options.get('par-nested')
+        if self.nested is None:
+            self.nested = self.NESTED
+
         if key is not None:
             self.key = key
         else:
@@ -261,7 +276,7 @@ class Ompizer(object):
 
     def _find_collapsable(self, root, candidates):
         collapsable = []
-        if ncores() >= self.COLLAPSE_NCORES:
+        if ncores() >= self.collapse_ncores:
             for n, i in enumerate(candidates[1:], 1):
                 # The Iteration nest [root, ..., i] must be perfect
                 if not IsPerfectIteration(depth=i).visit(root):
@@ -288,7 +303,7 @@ class Ompizer(object):
                 if nested:
                     try:
                         work = prod([int(j.dim.symbolic_size) for j in nested])
-                        if work < self.COLLAPSE_WORK:
+                        if work < self.collapse_work:
                             break
                     except TypeError:
                         pass
@@ -380,7 +395,7 @@ class Ompizer(object):
 
     def _make_nested_partree(self, partree):
         # Apply heuristic
-        if nhyperthreads() <= Ompizer.NESTED:
+        if nhyperthreads() <= self.nested:
             return partree
 
         # Note: there might be multiple sub-trees amenable to nested parallelism,
@@ -1,5 +1,7 @@
-from devito import Function, TimeFunction
-from devito.tools import memoized_meth
+from multiprocessing import Process
+
+from devito import Function, TimeFunction, configuration
+from devito.tools import as_tuple, memoized_meth
 from examples.seismic import PointSource, Receiver
 from examples.seismic.acoustic.operators import (
     ForwardOperator, AdjointOperator, GradientOperator, BornOperator
@@ -25,8 +27,30 @@ class AcousticWaveSolver(object):
         Type of discretization, centered or shifted.
     space_order: int, optional
         Order of the spatial stencil discretisation. Defaults to 4.
+    blockinner : bool, optional
+        Whether the innermost loop should be blocked too. Defaults to the
+        ``configuration['opt-options']`` value.
+    blocklevels : int, optional
+        Number of levels of loop blocking. Defaults to the
+        ``configuration['opt-options']`` value.
+    eager_compile : bool, optional
+        If True, upon construction, build and jit-compile the Operators in a
+        separate process, which populates the JIT cache while the first
+        modelling runs proceed. Defaults to False.
+    **kwargs
+        Compiler options, such as ``opt``, passed to all of the Operators.
+
+    Notes
+    -----
+    The forward, adjoint, gradient and Born Operators are built and compiled
+    lazily, once per solver, and then cached; with `eager_compile`, their
+    compilation typically reduces to a JIT cache hit. Hence, `model`,
+    `geometry`, `kernel`, `space_order` and the compiler options must not be
+    altered after construction; the runtime data (e.g. `vp`, `src`, `rec`)
+    may instead be passed to the modelling functions at each call.
     """
-    def __init__(self, model, geometry, kernel='OT2', space_order=4, **kwargs):
+    def __init__(self, model, geometry, kernel='OT2', space_order=4,
+                 blockinner=None, blocklevels=None, eager_compile=False, **kwargs):
         self.model = model
         self.geometry = geometry
 
@@ -43,6 +67,25 @@ class AcousticWaveSolver(object):
         # Cache compiler options
         self._kwargs = kwargs
 
+        # Loop blocking options, to be merged into the `opt` compiler option
+        options = {k: v for k, v in [('blockinner', blockinner),
+                                     ('blocklevels', blocklevels)] if v is not None}
+        if options:
+            opt = kwargs.get('opt', configuration['opt'])
+            if isinstance(opt, tuple) and opt and isinstance(opt[-1], dict):
+                opt = opt[:-1] + (dict(opt[-1], **options),)
+            else:
+                opt = as_tuple(opt or 'noop') + (options,)
+            self._kwargs['opt'] = opt
+
+        # Scratch wavefields, allocated once and reused across calls
+        self._scratch = {}
+
+        # Devito's symbolic layer is not thread-safe, so the Operators are
+        # warmed up in a separate process rather than in background threads
+        if eager_compile:
+            Process(target=self._warm_up).start()
+
     @memoized_meth
     def op_fwd(self, save=None):
         """Cached operator for forward runs with buffered wavefield"""
@@ -71,6 +114,32 @@ class AcousticWaveSolver(object):
                             kernel=self.kernel, space_order=self.space_order,
                             **self._kwargs)
 
+    def _warm_up(self):
+        """
+        Build and jit-compile the Operators, thus populating the JIT cache.
+        Only meant to be run in a separate process; the Operators are then
+        built again, lazily, by the solver itself.
+        """
+        for op, args in [(self.op_fwd, ()), (self.op_fwd, (True,)),
+                         (self.op_adj, ()), (self.op_grad, ()), (self.op_born, ())]:
+            # Accessing `cfunction` triggers the jit-compilation
+            op(*args).cfunction
+
+    def _scratch_wavefield(self, name):
+        """
+        Zero-initialized TimeFunction for wavefields that are only used
+        internally, that is never returned to the caller. The underlying
+        memory is allocated once and then reused by subsequent calls.
+        """
+        try:
+            field = self._scratch[name]
+            field.data_with_halo.fill(0)
+        except KeyError:
+            field = TimeFunction(name=name, grid=self.model.grid,
+                                 time_order=2, space_order=self.space_order)
+            self._scratch[name] = field
+        return field
+
     def forward(self, src=None, rec=None, u=None, vp=None, save=None, **kwargs):
         """
         Forward modelling function that creates the necessary
@@ -94,19 +163,21 @@ class AcousticWaveSolver(object):
         Receiver, wavefield and performance summary
         """
         # Source term is read-only, so re-use the default
-        src = src or self.geometry.src
+        src = self.geometry.src if src is None else src
         # Create a new receiver object to store the result
-        rec = rec or Receiver(name='rec', grid=self.model.grid,
-                              time_range=self.geometry.time_axis,
-                              coordinates=self.geometry.rec_positions)
+        if rec is None:
+            rec = Receiver(name='rec', grid=self.model.grid,
+                           time_range=self.geometry.time_axis,
+                           coordinates=self.geometry.rec_positions)
 
         # Create the forward wavefield if not provided
-        u = u or TimeFunction(name='u', grid=self.model.grid,
-                              save=self.geometry.nt if save else None,
-                              time_order=2, space_order=self.space_order)
+        if u is None:
+            u = TimeFunction(name='u', grid=self.model.grid,
+                             save=self.geometry.nt if save else None,
+                             time_order=2, space_order=self.space_order)
 
         # Pick vp from model unless explicitly provided
-        vp = vp or self.model.vp
+        vp = self.model.vp if vp is None else vp
 
         # Execute operator and return wavefield and receiver data
         summary = self.op_fwd(save).apply(src=src, rec=rec, u=u, vp=vp,
@@ -136,16 +207,18 @@ class AcousticWaveSolver(object):
         Adjoint source, wavefield and performance summary.
         """
         # Create a new adjoint source and receiver symbol
-        srca = srca or PointSource(name='srca', grid=self.model.grid,
-                                   time_range=self.geometry.time_axis,
-                                   coordinates=self.geometry.src_positions)
+        if srca is None:
+            srca = PointSource(name='srca', grid=self.model.grid,
+                               time_range=self.geometry.time_axis,
+                               coordinates=self.geometry.src_positions)
 
         # Create the adjoint wavefield if not provided
-        v = v or TimeFunction(name='v', grid=self.model.grid,
-                              time_order=2, space_order=self.space_order)
+        if v is None:
+            v = TimeFunction(name='v', grid=self.model.grid,
+                             time_order=2, space_order=self.space_order)
 
         # Pick vp from model unless explicitly provided
-        vp = vp or self.model.vp
+        vp = self.model.vp if vp is None else vp
 
         # Execute operator and return wavefield and receiver data
         summary = self.op_adj().apply(srca=srca, rec=rec, v=v, vp=vp,
@@ -174,21 +247,27 @@ class AcousticWaveSolver(object):
         Returns
         -------
         Gradient field and performance summary.
+
+        Notes
+        -----
+        Unless `v` is provided, the adjoint wavefield (and, with `checkpointing`,
+        the forward wavefield too) is a scratch buffer owned by the solver and
+        reused across calls. Hence, `gradient` must not be called concurrently
+        on the same solver.
         """
         dt = kwargs.pop('dt', self.dt)
         # Gradient symbol
-        grad = grad or Function(name='grad', grid=self.model.grid)
+        grad = Function(name='grad', grid=self.model.grid) if grad is None else grad
 
-        # Create the forward wavefield
-        v = v or TimeFunction(name='v', grid=self.model.grid,
-                              time_order=2, space_order=self.space_order)
+        # Create the adjoint wavefield if not provided. As it is not returned,
+        # the same memory may safely be reused across calls
+        v = self._scratch_wavefield('v') if v is None else v
 
         # Pick vp from model unless explicitly provided
-        vp = vp or self.model.vp
+        vp = self.model.vp if vp is None else vp
 
         if checkpointing:
-            u = TimeFunction(name='u', grid=self.model.grid,
-                             time_order=2, space_order=self.space_order)
+            u = self._scratch_wavefield('u')
             cp = DevitoCheckpoint([u])
             n_checkpoints = None
             wrap_fw = CheckpointOperator(self.op_fwd(save=False), src=self.geometry.src,
@@ -212,6 +291,9 @@ class AcousticWaveSolver(object):
 
         Parameters
         ----------
+        dmin : Function or ndarray
+            The model perturbation. ndarray inputs must have shape
+            `model.grid.shape` and the model dtype.
         src : SparseTimeFunction or array_like, optional
             Time series data for the injected source term.
         rec : SparseTimeFunction or array_like, optional
@@ -222,22 +304,31 @@ class AcousticWaveSolver(object):
             The linearized wavefield.
         vp : Function or float, optional
             The time-constant velocity.
+
+        Returns
+        -------
+        Receiver, forward wavefield, linearized wavefield and performance summary.
+        As in `forward`, the Receiver itself is returned, so its data is only
+        accessed, via `rec.data`, if and when the caller needs it.
         """
         # Source term is read-only, so re-use the default
-        src = src or self.geometry.src
+        src = self.geometry.src if src is None else src
         # Create a new receiver object to store the result
-        rec = rec or Receiver(name='rec', grid=self.model.grid,
-                              time_range=self.geometry.time_axis,
-                              coordinates=self.geometry.rec_positions)
+        if rec is None:
+            rec = Receiver(name='rec', grid=self.model.grid,
+                           time_range=self.geometry.time_axis,
+                           coordinates=self.geometry.rec_positions)
 
         # Create the forward wavefields u and U if not provided
-        u = u or TimeFunction(name='u', grid=self.model.grid,
-                              time_order=2, space_order=self.space_order)
-        U = U or TimeFunction(name='U', grid=self.model.grid,
-                              time_order=2, space_order=self.space_order)
+        if u is None:
+            u = TimeFunction(name='u', grid=self.model.grid,
+                             time_order=2, space_order=self.space_order)
+        if U is None:
+            U = TimeFunction(name='U', grid=self.model.grid,
+                             time_order=2, space_order=self.space_order)
 
         # Pick vp from model unless explicitly provided
-        vp = vp or self.model.vp
+        vp = self.model.vp if vp is None else vp
 
         # Execute operator and return wavefield and receiver data
         summary = self.op_born().apply(dm=dmin, u=u, U=U, src=src, rec=rec,
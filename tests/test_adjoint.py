@@ -101,6 +101,43 @@ class TestAdjoint(object):
              % (term1, term2, (term1 - term2)/term1, term1 / term2))
         assert np.isclose((term1 - term2)/term1, 0., atol=1.e-12)
 
+    def test_adjoint_F_eager_compile(self, shape=(60, 70)):
+        """
+        Same as `test_adjoint_F`, but with the Operators built and jit-compiled
+        in a separate process upon construction of the solver.
+        """
+        solver = acoustic_setup(shape=shape, spacing=[15. for _ in shape], nbl=10,
+                                tn=500., eager_compile=True, dtype=np.float64)
+
+        rec, _, _ = solver.forward(save=False)
+        srca, _, _ = solver.adjoint(rec=rec)
+
+        # Adjoint test: Verify <Ax,y> matches  <x, A^Ty> closely
+        term1 = np.dot(srca.data.reshape(-1), solver.geometry.src.data)
+        term2 = norm(rec) ** 2
+        assert np.isclose((term1 - term2)/term1, 0., atol=1.e-12)
+
+    def test_eager_compile_failure(self, monkeypatch, shape=(60, 70)):
+        """
+        Test that a failure while building the Operators eagerly does not
+        affect the solver, which then simply builds them lazily.
+        """
+        def fail(*args, **kwargs):
+            raise RuntimeError("Forced failure")
+
+        kwargs = dict(shape=shape, spacing=[15. for _ in shape], nbl=10, tn=500.)
+
+        # The separate process is forked at construction, so it sees the failure
+        with monkeypatch.context() as m:
+            m.setattr('examples.seismic.acoustic.wavesolver.ForwardOperator', fail)
+            solver = acoustic_setup(eager_compile=True, **kwargs)
+        rec, _, _ = solver.forward()
+
+        ref = acoustic_setup(**kwargs)
+        rec_ref, _, _ = ref.forward()
+
+        assert np.allclose(rec.data, rec_ref.data)
+
     @pytest.mark.parametrize('shape, coords', [
         ((11, 11), [(.05, .9), (.01, .8)]),
         ((11, 11, 11), [(.05, .9), (.01, .8), (0.07, 0.84)])
@@ -13,6 +13,7 @@ from devito.passes import NThreads, NThreadsNonaffine
 from devito.passes.iet.openmp import ParallelRegion
 from devito.tools import as_tuple
 from devito.types import Scalar
+from examples.seismic.acoustic import acoustic_setup
 
 
 def get_blocksizes(op, opt, grid, blockshape, level=0):
@@ -271,6 +272,26 @@ def test_cache_blocking_hierarchical(blockshape0, blockshape1, exception):
         assert False
 
 
+@pytest.mark.parametrize("kwargs,exp_iters", [
+    ({}, 5),
+    ({'blockinner': True}, 6),
+    ({'blocklevels': 2}, 7),
+    ({'blockinner': True, 'blocklevels': 2}, 9),
+    ({'blockinner': True, 'opt': ('advanced', {'blocklevels': 2})}, 9),
+])
+def test_cache_blocking_solver_options(kwargs, exp_iters):
+    """
+    Test that the loop blocking options given to a wave solver are forwarded
+    to its Operators.
+    """
+    solver = acoustic_setup(shape=(20, 20, 20), tn=10., **kwargs)
+
+    for op in [solver.op_fwd(save=False), solver.op_adj()]:
+        trees = retrieve_iteration_tree(op._func_table['bf0'].root)
+        assert len(trees) == 1
+        assert len(trees[0]) == exp_iters
+
+
 @pytest.mark.parametrize("blockinner", [True, False])
 def test_cache_blocking_imperfect_nest(blockinner):
     """
@@ -532,6 +553,28 @@ class TestNestedParallelism(object):
                                                   'schedule(dynamic,1) '
                                                   'num_threads(nthreads_nested)')
 
+    def test_collapsing_via_options(self):
+        """
+        As above, but overriding the Ompizer heuristics via `opt` options.
+        """
+        grid = Grid(shape=(3, 3, 3))
+
+        u = TimeFunction(name='u', grid=grid)
+
+        op = Operator(Eq(u.forward, u + 1),
+                      opt=('blocking', 'openmp', {'par-nested': 0,
+                                                  'par-collapse-ncores': 1,
+                                                  'par-collapse-work': 0}))
+
+        op.apply(t_M=9)
+        assert np.all(u.data[0] == 10)
+
+        iterations = FindNodes(Iteration).visit(op._func_table['bf0'])
+        assert iterations[0].pragmas[0].value == 'omp for collapse(2) schedule(dynamic,1)'
+        assert iterations[2].pragmas[0].value == ('omp parallel for collapse(2) '
+                                                  'schedule(dynamic,1) '
+                                                  'num_threads(nthreads_nested)')
+
     @patch("devito.passes.clusters.aliases.MIN_COST_ALIAS", 1)
     @patch("devito.passes.iet.openmp.Ompizer.NESTED", 0)
     @patch("devito.passes.iet.openmp.Ompizer.COLLAPSE_NCORES", 1)
@@ -51,6 +51,32 @@ class TestGradient(object):
         gradient2, _ = wave.gradient(residual, u0, vp=v0, checkpointing=False)
         assert np.allclose(gradient.data, gradient2.data)
 
+    @pytest.mark.parametrize('checkpointing', [True, False])
+    def test_gradient_repeated(self, checkpointing, shape=(50, 60), space_order=4):
+        """
+        Test that repeated gradient computations on the same solver yield
+        identical results, that is no stale data leaks from one call to the
+        next through the internally reused wavefields.
+        """
+        spacing = tuple(10. for _ in shape)
+        wave = setup(shape=shape, spacing=spacing, dtype=np.float64,
+                     space_order=space_order, nbl=20, tn=500.)
+
+        v0 = Function(name='v0', grid=wave.model.grid, space_order=space_order)
+        smooth(v0, wave.model.vp)
+
+        rec, _, _ = wave.forward()
+        rec0, u0, _ = wave.forward(vp=v0, save=True)
+
+        residual = Receiver(name='rec', grid=wave.model.grid, data=rec0.data - rec.data,
+                            time_range=wave.geometry.time_axis,
+                            coordinates=wave.geometry.rec_positions)
+
+        gradient, _ = wave.gradient(residual, u0, vp=v0, checkpointing=checkpointing)
+        gradient2, _ = wave.gradient(residual, u0, vp=v0, checkpointing=checkpointing)
+        assert np.linalg.norm(gradient.data) > 0
+        assert np.all(gradient.data == gradient2.data)
+
     @pytest.mark.parametrize('space_order', [4])
     @pytest.mark.parametrize('kernel', ['OT2'])
     @pytest.mark.parametrize('shape', [(70, 80)])
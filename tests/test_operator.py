@@ -7,10 +7,15 @@ from devito import (Grid, Eq, Operator, Constant, Function, TimeFunction,
                     SparseFunction, SparseTimeFunction, Dimension, error, SpaceDimension,
                     NODE, CELL, dimensions, configuration, TensorFunction,
                     TensorTimeFunction, VectorFunction, VectorTimeFunction)
+from devito.archinfo import Cpu64, Intel64, Arm, Device
+from devito.core.cpu import (CPU64NoopOperator, CPU64Operator, Intel64Operator,
+                             Intel64FSGOperator, ArmOperator)
+from devito.core.gpu_openmp import DeviceOpenMPOperator, DeviceOpenMPCustomOperator
 from devito.ir.equations import ClusterizedEq
 from devito.ir.iet import (Callable, Conditional, Expression, Iteration, TimedList,
                            FindNodes, IsPerfectIteration, retrieve_iteration_tree)
 from devito.ir.support import Any, Backward, Forward
+from devito.operator.registry import operator_selector
 from devito.passes.iet import DataManager
 from devito.symbolics import ListInitializer, indexify, retrieve_indexed
 from devito.tools import flatten, powerset
@@ -1697,3 +1702,34 @@ class TestLoopScheduling(object):
         assert tree[0].dim is time
         assert tree[1].dim is x
         assert tree[2].dim is y
+
+
+class TestOperatorSelection(object):
+
+    @pytest.mark.parametrize('platform,mode,expected', [
+        (Cpu64('cpu64'), 'advanced', CPU64Operator),
+        (Intel64('skx'), 'noop', CPU64NoopOperator),
+        (Intel64('skx'), 'advanced', Intel64Operator),
+        (Intel64('skx'), 'advanced-fsg', Intel64FSGOperator),
+        (Arm('arm'), 'advanced', ArmOperator),
+        (Device('nvidiaX'), 'advanced', DeviceOpenMPOperator),
+        (Device('nvidiaX'), ('blocking', 'openmp'), DeviceOpenMPCustomOperator),
+    ])
+    def test_registered(self, platform, mode, expected):
+        assert operator_selector(platform=platform, mode=mode) is expected
+
+    def test_unregistered_subclass(self):
+        """
+        Test that an unregistered platform falls back to the Operator of
+        its closest registered ancestor.
+        """
+        class MyIntel64(Intel64):
+            pass
+
+        platform = MyIntel64('myintel64')
+        assert operator_selector(platform=platform, mode='advanced') is Intel64Operator
+
+    def test_unknown_language(self):
+        with pytest.raises(ValueError):
+            operator_selector(platform=Intel64('skx'), mode='advanced',
+                              language='CUDA')